@@ -190,7 +190,7 @@ class ReportViewSet(ViewSet):
         Compile all reports and their related results (if any). Result data is deferred in the list view.
         """
         report_list = []
-        report_content_type = ContentType.objects.get(app_label='extras', model='report')
+        report_content_type = ContentType.objects.get_by_natural_key('extras', 'report')
         results = {
             r.name: r
             for r in JobResult.objects.filter(
@@ -220,7 +220,7 @@ class ReportViewSet(ViewSet):
 
         # Retrieve the Report and JobResult, if any.
         report = self._retrieve_report(pk)
-        report_content_type = ContentType.objects.get(app_label='extras', model='report')
+        report_content_type = ContentType.objects.get_by_natural_key('extras', 'report')
         report.result = JobResult.objects.filter(
             obj_type=report_content_type,
             name=report.full_name,
@@ -248,7 +248,7 @@ class ReportViewSet(ViewSet):
 
         # Retrieve and run the Report. This will create a new JobResult.
         report = self._retrieve_report(pk)
-        report_content_type = ContentType.objects.get(app_label='extras', model='report')
+        report_content_type = ContentType.objects.get_by_natural_key('extras', 'report')
         job_result = JobResult.enqueue_job(
             run_report,
             report.full_name,
@@ -281,7 +281,7 @@ class ScriptViewSet(ViewSet):
 
     def list(self, request):
 
-        script_content_type = ContentType.objects.get(app_label='extras', model='script')
+        script_content_type = ContentType.objects.get_by_natural_key('extras', 'script')
         results = {
             r.name: r
             for r in JobResult.objects.filter(
@@ -304,7 +304,7 @@ class ScriptViewSet(ViewSet):
 
     def retrieve(self, request, pk):
         script = self._get_script(pk)
-        script_content_type = ContentType.objects.get(app_label='extras', model='script')
+        script_content_type = ContentType.objects.get_by_natural_key('extras', 'script')
         script.result = JobResult.objects.filter(
             obj_type=script_content_type,
             name=script.full_name,
@@ -329,7 +329,7 @@ class ScriptViewSet(ViewSet):
             data = input_serializer.data['data']
             commit = input_serializer.data['commit']
 
-            script_content_type = ContentType.objects.get(app_label='extras', model='script')
+            script_content_type = ContentType.objects.get_by_natural_key('extras', 'script')
             job_result = JobResult.enqueue_job(
                 run_script,
                 script.full_name,
@@ -2,7 +2,9 @@ from contextlib import contextmanager
 
 from django.db.models.signals import m2m_changed, pre_delete, post_save
 
-from extras.signals import clear_webhooks, _clear_webhook_queue, _handle_changed_object, _handle_deleted_object
+from extras.signals import (
+    clear_webhooks, flush_objectchanges, _clear_webhook_queue, _handle_changed_object, _handle_deleted_object,
+)
 from utilities.utils import curry
 from .webhooks import flush_webhooks
 
@@ -16,10 +18,11 @@ def change_logging(request):
     :param request: WSGIRequest object with a unique `id` set
     """
     webhook_queue = []
+    webhooks_cache = {}
 
     # Curry signals receivers to pass the current request
-    handle_changed_object = curry(_handle_changed_object, request, webhook_queue)
-    handle_deleted_object = curry(_handle_deleted_object, request, webhook_queue)
+    handle_changed_object = curry(_handle_changed_object, request, webhook_queue, webhooks_cache)
+    handle_deleted_object = curry(_handle_deleted_object, request, webhook_queue, webhooks_cache)
     clear_webhook_queue = curry(_clear_webhook_queue, webhook_queue)
 
     # Connect our receivers to the post_save and post_delete signals.
@@ -40,3 +43,31 @@ def change_logging(request):
     # Flush queued webhooks to RQ
     flush_webhooks(webhook_queue)
     del webhook_queue
+    del webhooks_cache
+
+
+@contextmanager
+def defer_objectchanges(request):
+    """
+    Queue the ObjectChanges recorded while making changes in bulk, and save them with a single bulk INSERT (per batch)
+    once the code block completes. This must be entered *inside* the transaction in which the changes are made, so
+    that the ObjectChanges are saved (or rolled back) along with them. Queued ObjectChanges are discarded if an
+    exception is raised.
+
+    :param request: The current request (a REST API request will be unwrapped)
+    """
+    request = getattr(request, '_request', request)
+
+    # Defer to the outermost block if already deferring
+    if hasattr(request, '_objectchange_queue'):
+        yield
+        return
+
+    request._objectchange_queue = []
+    request._objectchange_index = {}
+    try:
+        yield
+        flush_objectchanges(request._objectchange_queue)
+    finally:
+        del request._objectchange_queue
+        del request._objectchange_index
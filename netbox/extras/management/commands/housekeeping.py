@@ -1,16 +1,21 @@
 from datetime import timedelta
 from importlib import import_module
+from operator import itemgetter
 
 import requests
 from django.conf import settings
 from django.core.cache import cache
 from django.core.management.base import BaseCommand
 from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Max, Min
 from django.utils import timezone
 from packaging import version
 
 from extras.models import ObjectChange
 
+# Size of the primary key range covered by each changelog deletion query
+HOUSEKEEPING_BATCH_SIZE = 50000
+
 
 class Command(BaseCommand):
     help = "Perform nightly housekeeping tasks. (This command can be run at any time.)"
@@ -38,12 +43,17 @@ class Command(BaseCommand):
             if options['verbosity'] >= 2:
                 self.stdout.write(f"Retention period: {settings.CHANGELOG_RETENTION} days")
                 self.stdout.write(f"\tCut-off time: {cutoff}")
-            expired_records = ObjectChange.objects.filter(time__lt=cutoff).count()
-            if expired_records:
-                self.stdout.write(f"\tDeleting {expired_records} expired records... ", self.style.WARNING, ending="")
-                self.stdout.flush()
-                ObjectChange.objects.filter(time__lt=cutoff)._raw_delete(using=DEFAULT_DB_ALIAS)
-                self.stdout.write("Done.", self.style.WARNING)
+            expired_records = ObjectChange.objects.filter(time__lt=cutoff)
+            if expired_records.exists():
+                # Delete by fixed-size PK ranges to avoid a single long-running DELETE (and COUNT) on large tables
+                self.stdout.write("\tDeleting expired records...", self.style.WARNING)
+                min_pk, max_pk = expired_records.aggregate(Min('pk'), Max('pk')).values()
+                for lower in range(min_pk, max_pk + 1, HOUSEKEEPING_BATCH_SIZE):
+                    upper = lower + HOUSEKEEPING_BATCH_SIZE
+                    expired_records.filter(pk__gte=lower, pk__lt=upper)._raw_delete(using=DEFAULT_DB_ALIAS)
+                    self.stdout.write(f"\t\tProcessed records {lower} to {min(upper, max_pk + 1) - 1}")
+                    self.stdout.flush()
+                self.stdout.write("\tDone.", self.style.WARNING)
             else:
                 self.stdout.write("\tNo expired records found.")
         else:
@@ -67,13 +77,14 @@ class Command(BaseCommand):
                 )
                 response.raise_for_status()
 
-                releases = []
-                for release in response.json():
-                    if 'tag_name' not in release or release.get('devrelease') or release.get('prerelease'):
-                        continue
-                    releases.append((version.parse(release['tag_name']), release.get('html_url')))
-                latest_release = max(releases)
-                self.stdout.write(f"\tFound {len(response.json())} releases; {len(releases)} usable")
+                payload = response.json()
+                releases = [
+                    (version.parse(release['tag_name']), release.get('html_url'))
+                    for release in payload
+                    if 'tag_name' in release and not release.get('devrelease') and not release.get('prerelease')
+                ]
+                latest_release = max(releases, key=itemgetter(0))
+                self.stdout.write(f"\tFound {len(payload)} releases; {len(releases)} usable")
                 self.stdout.write(f"\tLatest release: {latest_release[0]}")
 
                 # Cache the most recent release
@@ -30,7 +30,7 @@ class Command(BaseCommand):
                         "[{:%H:%M:%S}] Running {}...".format(timezone.now(), report.full_name)
                     )
 
-                    report_content_type = ContentType.objects.get(app_label='extras', model='report')
+                    report_content_type = ContentType.objects.get_by_natural_key('extras', 'report')
                     job_result = JobResult.enqueue_job(
                         run_report,
                         report.full_name,
@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -11,6 +12,9 @@ from .choices import ObjectChangeActionChoices
 from .models import CustomField, ObjectChange
 from .webhooks import enqueue_object, get_snapshots, serialize_for_webhook
 
+# Maximum number of queued ObjectChanges to save per query
+OBJECTCHANGE_BATCH_SIZE = 1000
+
 
 #
 # Change logging/webhooks
@@ -20,18 +24,46 @@ from .webhooks import enqueue_object, get_snapshots, serialize_for_webhook
 clear_webhooks = Signal()
 
 
-def _handle_changed_object(request, webhook_queue, sender, instance, **kwargs):
+def record_objectchange(request, objectchange):
     """
-    Fires when an object is created or updated.
+    Save an ObjectChange for the given request. If ObjectChanges are being deferred (see defer_objectchanges()), queue
+    it to be saved in bulk instead.
     """
-    def is_same_object(instance, webhook_data):
-        return (
-            ContentType.objects.get_for_model(instance) == webhook_data['content_type'] and
-            instance.pk == webhook_data['object_id'] and
-            request.id == webhook_data['request_id']
-        )
+    objectchange.user = request.user
+    objectchange.user_name = request.user.username
+    objectchange.request_id = request.id
 
-    if not hasattr(instance, 'to_objectchange'):
+    queue = getattr(request, '_objectchange_queue', None)
+    if queue is None:
+        objectchange.save()
+        return
+
+    queue.append(objectchange)
+    key = (objectchange.changed_object_type_id, objectchange.changed_object_id)
+    request._objectchange_index.setdefault(key, []).append(objectchange)
+
+
+def flush_objectchanges(queue):
+    """
+    Save all queued ObjectChanges to the database.
+    """
+    ObjectChange.objects.bulk_create(queue, batch_size=OBJECTCHANGE_BATCH_SIZE)
+
+
+@lru_cache(maxsize=None)
+def _is_changelogged(model):
+    """
+    Return True if the given model class supports change logging. Cached per model to avoid an attribute probe on
+    every signal.
+    """
+    return hasattr(model, 'to_objectchange')
+
+
+def _handle_changed_object(request, webhook_queue, webhooks_cache, sender, instance, **kwargs):
+    """
+    Fires when an object is created or updated.
+    """
+    if not _is_changelogged(type(instance)):
         return
 
     m2m_changed = False
@@ -48,53 +80,66 @@ def _handle_changed_object(request, webhook_queue, sender, instance, **kwargs):
     else:
         return
 
-    # Record an ObjectChange if applicable
-    if hasattr(instance, 'to_objectchange'):
-        if m2m_changed:
+    content_type = ContentType.objects.get_for_model(instance)
+    model_name = instance._meta.model_name
+
+    # Record an ObjectChange
+    if m2m_changed:
+        postchange_data = instance.to_objectchange(action).postchange_data
+        # Update any queued ObjectChanges for this object. If none are pending, update those which have already been
+        # recorded for this request.
+        pending_objectchanges = getattr(request, '_objectchange_index', {}).get((content_type.pk, instance.pk))
+        if pending_objectchanges:
+            for objectchange in pending_objectchanges:
+                objectchange.postchange_data = postchange_data
+        else:
             ObjectChange.objects.filter(
-                changed_object_type=ContentType.objects.get_for_model(instance),
+                changed_object_type=content_type,
                 changed_object_id=instance.pk,
                 request_id=request.id
             ).update(
-                postchange_data=instance.to_objectchange(action).postchange_data
+                postchange_data=postchange_data
             )
-        else:
-            objectchange = instance.to_objectchange(action)
-            objectchange.user = request.user
-            objectchange.request_id = request.id
-            objectchange.save()
+    else:
+        record_objectchange(request, instance.to_objectchange(action))
 
     # If this is an M2M change, update the previously queued webhook (from post_save)
-    if m2m_changed and webhook_queue and is_same_object(instance, webhook_queue[-1]):
-        instance.refresh_from_db()  # Ensure that we're working with fresh M2M assignments
-        webhook_queue[-1]['data'] = serialize_for_webhook(instance)
-        webhook_queue[-1]['snapshots']['postchange'] = get_snapshots(instance, action)['postchange']
+    if (
+        m2m_changed and
+        webhook_queue and
+        webhook_queue[-1]['content_type'] == content_type and
+        webhook_queue[-1]['object_id'] == instance.pk and
+        webhook_queue[-1]['request_id'] == request.id
+    ):
+        if webhook_queue[-1]['webhooks']:
+            instance.refresh_from_db()  # Ensure that we're working with fresh M2M assignments
+            webhook_queue[-1]['data'] = serialize_for_webhook(instance)
+            webhook_queue[-1]['snapshots']['postchange'] = get_snapshots(instance, action)['postchange']
     else:
-        enqueue_object(webhook_queue, instance, request.user, request.id, action)
+        enqueue_object(webhook_queue, instance, request.user, request.id, action, webhooks_cache)
 
     # Increment metric counters
     if action == ObjectChangeActionChoices.ACTION_CREATE:
-        model_inserts.labels(instance._meta.model_name).inc()
+        model_inserts.labels(model_name).inc()
     elif action == ObjectChangeActionChoices.ACTION_UPDATE:
-        model_updates.labels(instance._meta.model_name).inc()
+        model_updates.labels(model_name).inc()
 
 
-def _handle_deleted_object(request, webhook_queue, sender, instance, **kwargs):
+def _handle_deleted_object(request, webhook_queue, webhooks_cache, sender, instance, **kwargs):
     """
     Fires when an object is deleted.
     """
-    if not hasattr(instance, 'to_objectchange'):
+    if not _is_changelogged(type(instance)):
         return
 
-    # Record an ObjectChange if applicable
-    if hasattr(instance, 'to_objectchange'):
-        objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
-        objectchange.user = request.user
-        objectchange.request_id = request.id
-        objectchange.save()
+    # Record an ObjectChange
+    objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
+    record_objectchange(request, objectchange)
 
     # Enqueue webhooks
-    enqueue_object(webhook_queue, instance, request.user, request.id, ObjectChangeActionChoices.ACTION_DELETE)
+    enqueue_object(
+        webhook_queue, instance, request.user, request.id, ObjectChangeActionChoices.ACTION_DELETE, webhooks_cache
+    )
 
     # Increment metric counters
     model_deletes.labels(instance._meta.model_name).inc()
@@ -119,7 +164,7 @@ def handle_cf_added_obj_types(instance, action, pk_set, **kwargs):
     Handle the population of default/null values when a CustomField is added to one or more ContentTypes.
     """
     if action == 'post_add':
-        instance.populate_initial_data(ContentType.objects.filter(pk__in=pk_set))
+        instance.populate_initial_data([ContentType.objects.get_for_id(pk) for pk in pk_set])
 
 
 def handle_cf_removed_obj_types(instance, action, pk_set, **kwargs):
@@ -127,7 +172,7 @@ def handle_cf_removed_obj_types(instance, action, pk_set, **kwargs):
     Handle the cleanup of old custom field data when a CustomField is removed from one or more ContentTypes.
     """
     if action == 'post_remove':
-        instance.remove_stale_data(ContentType.objects.filter(pk__in=pk_set))
+        instance.remove_stale_data([ContentType.objects.get_for_id(pk) for pk in pk_set])
 
 
 def handle_cf_renamed(instance, created, **kwargs):
@@ -157,7 +202,8 @@ m2m_changed.connect(handle_cf_removed_obj_types, sender=CustomField.content_type
 
 @receiver(post_clean)
 def run_custom_validators(sender, instance, **kwargs):
-    model_name = f'{sender._meta.app_label}.{sender._meta.model_name}'
-    validators = settings.CUSTOM_VALIDATORS.get(model_name, [])
+    if not settings.CUSTOM_VALIDATORS:
+        return
+    validators = settings.CUSTOM_VALIDATORS.get(sender._meta.label_lower, [])
     for validator in validators:
         validator(instance)
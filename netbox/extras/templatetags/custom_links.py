@@ -1,11 +1,11 @@
-from collections import OrderedDict
+from functools import lru_cache
 
 from django import template
 from django.contrib.contenttypes.models import ContentType
 from django.utils.safestring import mark_safe
+from jinja2.sandbox import SandboxedEnvironment
 
 from extras.models import CustomLink
-from utilities.utils import render_jinja2
 
 
 register = template.Library()
@@ -30,13 +30,44 @@ GROUP_BUTTON = """
 GROUP_LINK = '<li><a class="dropdown-item" href="{}"{}>{}</a></li>\n'
 
 
+@lru_cache(maxsize=512)
+def get_template(template_code):
+    """
+    Return a compiled Jinja2 template for the given code. Templates are cached so that each CustomLink is parsed only
+    once rather than every time it is rendered.
+    """
+    return SandboxedEnvironment().from_string(source=template_code)
+
+
+def render_link_template(template_code, context):
+    """
+    Render a (cached) Jinja2 template with the provided context.
+    """
+    return get_template(template_code).render(**context)
+
+
+def get_custom_links(request, content_type):
+    """
+    Return all CustomLinks for the given ContentType, caching the results on the request.
+    """
+    cache = getattr(request, '_custom_links_cache', None)
+    if cache is None:
+        cache = request._custom_links_cache = {}
+
+    custom_links = cache.get(content_type.pk)
+    if custom_links is None:
+        custom_links = cache[content_type.pk] = list(CustomLink.objects.filter(content_type=content_type))
+
+    return custom_links
+
+
 @register.simple_tag(takes_context=True)
 def custom_links(context, obj):
     """
     Render all applicable links for the given object.
     """
     content_type = ContentType.objects.get_for_model(obj)
-    custom_links = CustomLink.objects.filter(content_type=content_type)
+    custom_links = get_custom_links(context['request'], content_type)
     if not custom_links:
         return ''
 
@@ -49,22 +80,20 @@ def custom_links(context, obj):
         'perms': context['perms'],  # django.contrib.auth.context_processors.auth
     }
     template_code = ''
-    group_names = OrderedDict()
+    group_names = {}
 
     for cl in custom_links:
 
         # Organize custom links by group
-        if cl.group_name and cl.group_name in group_names:
-            group_names[cl.group_name].append(cl)
-        elif cl.group_name:
-            group_names[cl.group_name] = [cl]
+        if cl.group_name:
+            group_names.setdefault(cl.group_name, []).append(cl)
 
         # Add non-grouped links
         else:
             try:
-                text_rendered = render_jinja2(cl.link_text, link_context)
+                text_rendered = render_link_template(cl.link_text, link_context)
                 if text_rendered:
-                    link_rendered = render_jinja2(cl.link_url, link_context)
+                    link_rendered = render_link_template(cl.link_url, link_context)
                     link_target = ' target="_blank"' if cl.new_window else ''
                     template_code += LINK_BUTTON.format(
                         link_rendered, link_target, cl.button_class, text_rendered
@@ -80,10 +109,10 @@ def custom_links(context, obj):
 
         for cl in links:
             try:
-                text_rendered = render_jinja2(cl.link_text, link_context)
+                text_rendered = render_link_template(cl.link_text, link_context)
                 if text_rendered:
                     link_target = ' target="_blank"' if cl.new_window else ''
-                    link_rendered = render_jinja2(cl.link_url, link_context)
+                    link_rendered = render_link_template(cl.link_url, link_context)
                     links_rendered.append(
                         GROUP_LINK.format(link_rendered, link_target, text_rendered)
                     )
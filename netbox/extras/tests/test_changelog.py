@@ -1,9 +1,12 @@
+from unittest.mock import patch
+
 from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError
 from django.urls import reverse
 from rest_framework import status
 
 from dcim.choices import SiteStatusChoices
-from dcim.models import Site
+from dcim.models import Rack, Site
 from extras.choices import *
 from extras.models import CustomField, ObjectChange, Tag
 from utilities.testing import APITestCase
@@ -170,6 +173,42 @@ class ChangeLogViewTest(ModelViewTestCase):
         self.assertEqual(objectchange.postchange_data['status'], form_data['status'])
         self.assertEqual(objectchange.postchange_data['description'], form_data['description'])
 
+    def test_bulk_update_objects_rollback(self):
+        sites = (
+            Site(name='Site 1', slug='site-1', status=SiteStatusChoices.STATUS_ACTIVE),
+            Site(name='Site 2', slug='site-2', status=SiteStatusChoices.STATUS_ACTIVE),
+            Site(name='Site 3', slug='site-3', status=SiteStatusChoices.STATUS_ACTIVE),
+        )
+        Site.objects.bulk_create(sites)
+
+        form_data = {
+            'pk': [site.pk for site in sites],
+            '_apply': True,
+            'status': SiteStatusChoices.STATUS_PLANNED,
+        }
+
+        request = {
+            'path': self._get_url('bulk_edit'),
+            'data': post_data(form_data),
+        }
+        self.add_permissions('dcim.view_site', 'dcim.change_site')
+
+        # Simulate an unhandled database error after the last site has been saved
+        save = Site.save
+
+        def save_or_fail(site, *args, **kwargs):
+            save(site, *args, **kwargs)
+            if site.pk == sites[2].pk:
+                raise IntegrityError('Simulated failure')
+
+        with patch.object(Site, 'save', save_or_fail):
+            with self.assertRaises(IntegrityError):
+                self.client.post(**request)
+
+        # The changes have been rolled back, so nothing should have been logged
+        self.assertFalse(Site.objects.filter(status=SiteStatusChoices.STATUS_PLANNED).exists())
+        self.assertEqual(ObjectChange.objects.count(), 0)
+
     def test_bulk_delete_objects(self):
         sites = (
             Site(name='Site 1', slug='site-1', status=SiteStatusChoices.STATUS_ACTIVE),
@@ -203,6 +242,35 @@ class ChangeLogViewTest(ModelViewTestCase):
         self.assertEqual(objectchange.prechange_data['slug'], sites[0].slug)
         self.assertEqual(objectchange.postchange_data, None)
 
+    def test_bulk_delete_objects_protected(self):
+        sites = (
+            Site(name='Site 1', slug='site-1', status=SiteStatusChoices.STATUS_ACTIVE),
+            Site(name='Site 2', slug='site-2', status=SiteStatusChoices.STATUS_ACTIVE),
+            Site(name='Site 3', slug='site-3', status=SiteStatusChoices.STATUS_ACTIVE),
+        )
+        Site.objects.bulk_create(sites)
+
+        # Protect the last site from deletion
+        Rack.objects.create(name='Rack 1', site=sites[2])
+
+        form_data = {
+            'pk': [site.pk for site in sites],
+            'confirm': True,
+            '_confirm': True,
+        }
+
+        request = {
+            'path': self._get_url('bulk_delete'),
+            'data': post_data(form_data),
+        }
+        self.add_permissions('dcim.delete_site')
+        response = self.client.post(**request)
+        self.assertHttpStatus(response, 302)
+
+        # The deletion of the other sites has been rolled back, so nothing should have been logged
+        self.assertEqual(Site.objects.count(), 3)
+        self.assertEqual(ObjectChange.objects.count(), 0)
+
 
 class ChangeLogAPITest(APITestCase):
 
@@ -362,6 +430,35 @@ class ChangeLogAPITest(APITestCase):
         self.assertEqual(objectchange.postchange_data['name'], data[0]['name'])
         self.assertEqual(objectchange.postchange_data['slug'], data[0]['slug'])
 
+    def test_bulk_create_objects_with_tags(self):
+        data = (
+            {
+                'name': 'Site 1',
+                'slug': 'site-1',
+                'tags': [{'name': 'Tag 1'}, {'name': 'Tag 2'}],
+            },
+            {
+                'name': 'Site 2',
+                'slug': 'site-2',
+                'tags': [{'name': 'Tag 3'}],
+            },
+        )
+        url = reverse('dcim-api:site-list')
+        self.add_permissions('dcim.add_site', 'extras.view_tag')
+
+        response = self.client.post(url, data, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+
+        # Tags are assigned after each site is created; its single ObjectChange should reflect them
+        self.assertEqual(ObjectChange.objects.count(), 2)
+        for site_data, expected_tags in zip(response.data, (['Tag 1', 'Tag 2'], ['Tag 3'])):
+            objectchange = ObjectChange.objects.get(
+                changed_object_type=ContentType.objects.get_for_model(Site),
+                changed_object_id=site_data['id']
+            )
+            self.assertEqual(objectchange.action, ObjectChangeActionChoices.ACTION_CREATE)
+            self.assertEqual(objectchange.postchange_data['tags'], expected_tags)
+
     def test_bulk_edit_objects(self):
         sites = (
             Site(name='Site 1', slug='site-1'),
@@ -406,6 +503,32 @@ class ChangeLogAPITest(APITestCase):
         self.assertEqual(objectchange.postchange_data['name'], data[0]['name'])
         self.assertEqual(objectchange.postchange_data['slug'], data[0]['slug'])
 
+    def test_bulk_edit_objects_rollback(self):
+        sites = (
+            Site(name='Site 1', slug='site-1'),
+            Site(name='Site 2', slug='site-2'),
+        )
+        Site.objects.bulk_create(sites)
+
+        # The second update is invalid, so the first must be rolled back
+        data = (
+            {
+                'id': sites[0].pk,
+                'name': 'Site A',
+            },
+            {
+                'id': sites[1].pk,
+                'status': 'invalid',
+            },
+        )
+        url = reverse('dcim-api:site-list')
+        self.add_permissions('dcim.change_site')
+
+        response = self.client.patch(url, data, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Site.objects.get(pk=sites[0].pk).name, 'Site 1')
+        self.assertEqual(ObjectChange.objects.count(), 0)
+
     def test_bulk_delete_objects(self):
         sites = (
             Site(name='Site 1', slug='site-1'),
@@ -5,12 +5,14 @@ from unittest.mock import patch
 import django_rq
 from django.contrib.contenttypes.models import ContentType
 from django.http import HttpResponse
+from django.test import RequestFactory
 from django.urls import reverse
 from requests import Session
 from rest_framework import status
 
 from dcim.models import Site
 from extras.choices import ObjectChangeActionChoices
+from extras.context_managers import change_logging
 from extras.models import Tag, Webhook
 from extras.webhooks import enqueue_object, flush_webhooks, generate_signature
 from extras.webhooks_worker import process_webhook
@@ -251,6 +253,35 @@ class WebhookTest(APITestCase):
             self.assertEqual(job.kwargs['snapshots']['prechange']['name'], sites[i].name)
             self.assertEqual(job.kwargs['snapshots']['prechange']['tags'], ['Bar', 'Foo'])
 
+    def test_enqueue_webhook_create_update_delete(self):
+        request = RequestFactory().get('/')
+        request.id = uuid.uuid4()
+        request.user = self.user
+
+        # Create, update, and delete an object within a single request (e.g. a script)
+        with change_logging(request):
+            site = Site.objects.create(name='Site 1', slug='site-1')
+            site.tags.set(*Tag.objects.filter(name__in=['Foo', 'Bar']))
+            site.name = 'Site 2'
+            site.save()
+            site_id = site.pk
+            site.delete()
+
+        # Verify that each job reflects the state of the object at the time of the change
+        self.assertEqual(self.queue.count, 3)
+        create_job, update_job, delete_job = self.queue.jobs
+        self.assertEqual(create_job.kwargs['event'], ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(create_job.kwargs['data']['id'], site_id)
+        self.assertEqual(create_job.kwargs['data']['name'], 'Site 1')
+        self.assertEqual(len(create_job.kwargs['data']['tags']), 2)
+        self.assertEqual(create_job.kwargs['snapshots']['postchange']['name'], 'Site 1')
+        self.assertEqual(create_job.kwargs['snapshots']['postchange']['tags'], ['Bar', 'Foo'])
+        self.assertEqual(update_job.kwargs['event'], ObjectChangeActionChoices.ACTION_UPDATE)
+        self.assertEqual(update_job.kwargs['data']['name'], 'Site 2')
+        self.assertEqual(update_job.kwargs['snapshots']['postchange']['name'], 'Site 2')
+        self.assertEqual(delete_job.kwargs['event'], ObjectChangeActionChoices.ACTION_DELETE)
+        self.assertEqual(delete_job.kwargs['data']['id'], site_id)
+
     def test_webhooks_worker(self):
 
         request_id = uuid.uuid4()
@@ -1,5 +1,6 @@
 import collections
 
+from django.apps import apps
 from django.db.models import Q
 from django.utils.deconstruct import deconstructible
 from taggit.managers import _TaggableManager
@@ -7,6 +8,9 @@ from taggit.managers import _TaggableManager
 from extras.constants import EXTRAS_FEATURES
 from extras.registry import registry
 
+# File extensions preserved when renaming uploaded image attachments
+IMAGE_EXTENSIONS = frozenset(('bmp', 'gif', 'jpeg', 'jpg', 'png'))
+
 
 def is_taggable(obj):
     """
@@ -25,13 +29,13 @@ def image_upload(instance, filename):
     path = 'image-attachments/'
 
     # Rename the file to the provided name, if any. Attempt to preserve the file extension.
-    extension = filename.rsplit('.')[-1].lower()
-    if instance.name and extension in ['bmp', 'gif', 'jpeg', 'jpg', 'png']:
-        filename = '.'.join([instance.name, extension])
+    extension = filename.rpartition('.')[2].lower()
+    if instance.name and extension in IMAGE_EXTENSIONS:
+        filename = f'{instance.name}.{extension}'
     elif instance.name:
         filename = instance.name
 
-    return '{}{}_{}_{}'.format(path, instance.content_type.name, instance.object_id, filename)
+    return f'{path}{instance.content_type.name}_{instance.object_id}_{filename}'
 
 
 @deconstructible
@@ -42,6 +46,7 @@ class FeatureQuery:
     """
     def __init__(self, feature):
         self.feature = feature
+        self._query = None
 
     def __call__(self):
         return self.get_query()
@@ -50,10 +55,17 @@ class FeatureQuery:
         """
         Given an extras feature, return a Q object for content type lookup
         """
+        if self._query is not None:
+            return self._query
+
         query = Q()
         for app_label, models in registry['model_features'][self.feature].items():
             query |= Q(app_label=app_label, model__in=models)
 
+        # The registry is complete once all apps have been loaded, so the query can be cached from then on
+        if apps.ready:
+            self._query = query
+
         return query
 
 
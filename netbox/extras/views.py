@@ -608,7 +608,7 @@ class ReportListView(ContentTypePermissionRequiredMixin, View):
     def get(self, request):
 
         reports = get_reports()
-        report_content_type = ContentType.objects.get(app_label='extras', model='report')
+        report_content_type = ContentType.objects.get_by_natural_key('extras', 'report')
         results = {
             r.name: r
             for r in JobResult.objects.filter(
@@ -643,7 +643,7 @@ class ReportView(ContentTypePermissionRequiredMixin, View):
         if report is None:
             raise Http404
 
-        report_content_type = ContentType.objects.get(app_label='extras', model='report')
+        report_content_type = ContentType.objects.get_by_natural_key('extras', 'report')
         report.result = JobResult.objects.filter(
             obj_type=report_content_type,
             name=report.full_name,
@@ -673,7 +673,7 @@ class ReportView(ContentTypePermissionRequiredMixin, View):
             })
 
         # Run the Report. A new JobResult is created.
-        report_content_type = ContentType.objects.get(app_label='extras', model='report')
+        report_content_type = ContentType.objects.get_by_natural_key('extras', 'report')
         job_result = JobResult.enqueue_job(
             run_report,
             report.full_name,
@@ -692,7 +692,7 @@ class ReportResultView(ContentTypePermissionRequiredMixin, View):
         return 'extras.view_report'
 
     def get(self, request, job_result_pk):
-        report_content_type = ContentType.objects.get(app_label='extras', model='report')
+        report_content_type = ContentType.objects.get_by_natural_key('extras', 'report')
         jobresult = get_object_or_404(JobResult.objects.all(), pk=job_result_pk, obj_type=report_content_type)
 
         # Retrieve the Report and attach the JobResult to it
@@ -729,7 +729,7 @@ class ScriptListView(ContentTypePermissionRequiredMixin, View):
     def get(self, request):
 
         scripts = get_scripts(use_names=True)
-        script_content_type = ContentType.objects.get(app_label='extras', model='script')
+        script_content_type = ContentType.objects.get_by_natural_key('extras', 'script')
         results = {
             r.name: r
             for r in JobResult.objects.filter(
@@ -757,7 +757,7 @@ class ScriptView(ContentTypePermissionRequiredMixin, GetScriptMixin, View):
         form = script.as_form(initial=request.GET)
 
         # Look for a pending JobResult (use the latest one by creation timestamp)
-        script_content_type = ContentType.objects.get(app_label='extras', model='script')
+        script_content_type = ContentType.objects.get_by_natural_key('extras', 'script')
         script.result = JobResult.objects.filter(
             obj_type=script_content_type,
             name=script.full_name,
@@ -787,7 +787,7 @@ class ScriptView(ContentTypePermissionRequiredMixin, GetScriptMixin, View):
         elif form.is_valid():
             commit = form.cleaned_data.pop('_commit')
 
-            script_content_type = ContentType.objects.get(app_label='extras', model='script')
+            script_content_type = ContentType.objects.get_by_natural_key('extras', 'script')
             job_result = JobResult.enqueue_job(
                 run_script,
                 script.full_name,
@@ -814,7 +814,7 @@ class ScriptResultView(ContentTypePermissionRequiredMixin, GetScriptMixin, View)
 
     def get(self, request, job_result_pk):
         result = get_object_or_404(JobResult.objects.all(), pk=job_result_pk)
-        script_content_type = ContentType.objects.get(app_label='extras', model='script')
+        script_content_type = ContentType.objects.get_by_natural_key('extras', 'script')
         if result.obj_type != script_content_type:
             raise Http404
 
@@ -45,10 +45,35 @@ def generate_signature(request_body, secret):
     return hmac_prep.hexdigest()
 
 
-def enqueue_object(queue, instance, user, request_id, action):
+def get_webhooks(content_type, action, cache=None):
+    """
+    Return the enabled Webhooks which apply to the given content type and action. If a cache (dict) is provided, it is
+    used to avoid querying the same content type and action more than once.
+    """
+    if cache is not None and (content_type, action) in cache:
+        return cache[(content_type, action)]
+
+    action_flag = {
+        ObjectChangeActionChoices.ACTION_CREATE: 'type_create',
+        ObjectChangeActionChoices.ACTION_UPDATE: 'type_update',
+        ObjectChangeActionChoices.ACTION_DELETE: 'type_delete',
+    }[action]
+    webhooks = list(Webhook.objects.filter(
+        **{action_flag: True},
+        content_types=content_type,
+        enabled=True
+    ))
+
+    if cache is not None:
+        cache[(content_type, action)] = webhooks
+
+    return webhooks
+
+
+def enqueue_object(queue, instance, user, request_id, action, webhooks_cache=None):
     """
     Enqueue a serialized representation of a created/updated/deleted object for the processing of
-    webhooks once the request has completed.
+    webhooks once the request has completed. The object is serialized only if any webhooks apply to it.
     """
     # Determine whether this type of object supports webhooks
     app_label = instance._meta.app_label
@@ -56,12 +81,16 @@ def enqueue_object(queue, instance, user, request_id, action):
     if model_name not in registry['model_features']['webhooks'].get(app_label, []):
         return
 
+    content_type = ContentType.objects.get_for_model(instance)
+    webhooks = get_webhooks(content_type, action, webhooks_cache)
+
     queue.append({
-        'content_type': ContentType.objects.get_for_model(instance),
+        'content_type': content_type,
         'object_id': instance.pk,
         'event': action,
-        'data': serialize_for_webhook(instance),
-        'snapshots': get_snapshots(instance, action),
+        'webhooks': webhooks,
+        'data': serialize_for_webhook(instance) if webhooks else None,
+        'snapshots': get_snapshots(instance, action) if webhooks else None,
         'username': user.username,
         'request_id': request_id
     })
@@ -72,35 +101,13 @@ def flush_webhooks(queue):
     Flush a list of object representation to RQ for webhook processing.
     """
     rq_queue = get_queue('default')
-    webhooks_cache = {
-        'type_create': {},
-        'type_update': {},
-        'type_delete': {},
-    }
 
     for data in queue:
-
-        action_flag = {
-            ObjectChangeActionChoices.ACTION_CREATE: 'type_create',
-            ObjectChangeActionChoices.ACTION_UPDATE: 'type_update',
-            ObjectChangeActionChoices.ACTION_DELETE: 'type_delete',
-        }[data['event']]
-        content_type = data['content_type']
-
-        # Cache applicable Webhooks
-        if content_type not in webhooks_cache[action_flag]:
-            webhooks_cache[action_flag][content_type] = Webhook.objects.filter(
-                **{action_flag: True},
-                content_types=content_type,
-                enabled=True
-            )
-        webhooks = webhooks_cache[action_flag][content_type]
-
-        for webhook in webhooks:
+        for webhook in data['webhooks']:
             rq_queue.enqueue(
                 "extras.webhooks_worker.process_webhook",
                 webhook=webhook,
-                model_name=content_type.model,
+                model_name=data['content_type'].model,
                 event=data['event'],
                 data=data['data'],
                 snapshots=data['snapshots'],
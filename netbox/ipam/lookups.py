@@ -131,13 +131,7 @@ class NetIn(Lookup):
 
     @staticmethod
     def create_in_clause(clause_part, max_size):
-        clause_elements = [clause_part]
-        for offset in range(0, max_size):
-            if offset > 0:
-                clause_elements.append(', ')
-            clause_elements.append('%s')
-        clause_elements.append(')')
-        return ''.join(clause_elements)
+        return f"{clause_part}{', '.join(['%s'] * max_size)})"
 
 
 class NetHostContained(Lookup):
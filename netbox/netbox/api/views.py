@@ -18,6 +18,7 @@ from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet as ModelViewSet_
 from rq.worker import Worker
 
+from extras.context_managers import defer_objectchanges
 from extras.models import ExportTemplate
 from netbox.api import BulkOperationSerializer
 from netbox.api.authentication import IsAuthenticatedOrLoginNotRequired
@@ -75,7 +76,7 @@ class BulkUpdateModelMixin:
         return Response(data, status=status.HTTP_200_OK)
 
     def perform_bulk_update(self, objects, update_data, partial):
-        with transaction.atomic():
+        with transaction.atomic(), defer_objectchanges(self.request):
             data_list = []
             for obj in objects:
                 data = update_data.get(obj.id)
@@ -116,7 +117,7 @@ class BulkDestroyModelMixin:
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     def perform_bulk_destroy(self, objects):
-        with transaction.atomic():
+        with transaction.atomic(), defer_objectchanges(self.request):
             for obj in objects:
                 if hasattr(obj, 'snapshot'):
                     obj.snapshot()
@@ -244,7 +245,7 @@ class ModelViewSet(BulkUpdateModelMixin, BulkDestroyModelMixin, ModelViewSet_):
 
         # Enforce object-level permissions on save()
         try:
-            with transaction.atomic():
+            with transaction.atomic(), defer_objectchanges(self.request):
                 instance = serializer.save()
                 self._validate_objects(instance)
         except ObjectDoesNotExist:
@@ -36,17 +36,17 @@ OBJ_TYPE_CHOICES = (
 )
 
 
-def build_options():
-    options = [{"label": OBJ_TYPE_CHOICES[0][1], "items": []}]
-
-    for label, choices in OBJ_TYPE_CHOICES[1:]:
-        items = []
-
-        for value, choice_label in choices:
-            items.append({"label": choice_label, "value": value})
-
-        options.append({"label": label, "items": items})
-    return options
+# Search options grouped by object type; built once at import time
+OBJ_TYPE_OPTIONS = (
+    {"label": OBJ_TYPE_CHOICES[0][1], "items": ()},
+    *(
+        {
+            "label": label,
+            "items": tuple({"label": choice_label, "value": value} for value, choice_label in choices),
+        }
+        for label, choices in OBJ_TYPE_CHOICES[1:]
+    ),
+)
 
 
 class SearchForm(BootstrapMixin, forms.Form):
@@ -56,4 +56,4 @@ class SearchForm(BootstrapMixin, forms.Form):
     obj_type = forms.ChoiceField(
         choices=OBJ_TYPE_CHOICES, required=False, label='Type'
     )
-    options = build_options()
+    options = OBJ_TYPE_OPTIONS
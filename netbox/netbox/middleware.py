@@ -1,3 +1,6 @@
+import os
+import re
+import threading
 import uuid
 from urllib import parse
 import logging
@@ -9,12 +12,52 @@ from django.core.exceptions import ImproperlyConfigured
 from django.db import ProgrammingError
 from django.http import Http404, HttpResponseRedirect
 from django.urls import reverse
+from django.utils.functional import cached_property
 
 from extras.context_managers import change_logging
 from netbox.views import server_error
 from utilities.api import is_api_request, rest_api_server_error
 
 
+# Number of random bytes to read from the OS at a time when generating request IDs (enough for 256 IDs)
+REQUEST_ID_BUFFER_SIZE = 4096
+
+_request_id_buffer = threading.local()
+
+
+def _reset_request_id_buffer():
+    global _request_id_buffer
+    _request_id_buffer = threading.local()
+
+
+# Never share buffered random bytes with a forked process
+os.register_at_fork(after_in_child=_reset_request_id_buffer)
+
+
+def generate_request_id():
+    """
+    Return a random (version 4) UUID. Random bytes are read from the OS in bulk and buffered per thread, avoiding a
+    system call for every request.
+    """
+    state = _request_id_buffer
+    offset = getattr(state, 'offset', REQUEST_ID_BUFFER_SIZE)
+    if offset >= REQUEST_ID_BUFFER_SIZE:
+        state.buffer = os.urandom(REQUEST_ID_BUFFER_SIZE)
+        offset = 0
+    state.offset = offset + 16
+
+    return uuid.UUID(bytes=state.buffer[offset:offset + 16], version=4)
+
+
+def _is_api_request(request):
+    """
+    Wrapper for is_api_request() which caches the result on the request, as it may be checked by several middleware.
+    """
+    if not hasattr(request, '_is_api_request'):
+        request._is_api_request = is_api_request(request)
+    return request._is_api_request
+
+
 class LoginRequiredMiddleware(object):
     """
     If LOGIN_REQUIRED is True, redirect all non-authenticated users to the login page.
@@ -23,19 +66,26 @@ class LoginRequiredMiddleware(object):
     def __init__(self, get_response):
         self.get_response = get_response
 
+    @cached_property
+    def exempt_paths_re(self):
+        """
+        Compiled pattern matching paths which do not require authentication. This is built once, on first use.
+        """
+        exempt_paths = [
+            reverse('api-root'),
+            reverse('graphql'),
+        ]
+        if settings.METRICS_ENABLED:
+            exempt_paths.append(reverse('prometheus-django-metrics'))
+
+        return re.compile('|'.join(re.escape(path) for path in exempt_paths))
+
     def __call__(self, request):
         # Redirect unauthenticated requests (except those exempted) to the login page if LOGIN_REQUIRED is true
         if settings.LOGIN_REQUIRED and not request.user.is_authenticated:
-            # Determine exempt paths
-            exempt_paths = [
-                reverse('api-root'),
-                reverse('graphql'),
-            ]
-            if settings.METRICS_ENABLED:
-                exempt_paths.append(reverse('prometheus-django-metrics'))
 
             # Redirect unauthenticated requests
-            if not request.path_info.startswith(tuple(exempt_paths)) and request.path_info != settings.LOGIN_URL:
+            if not self.exempt_paths_re.match(request.path_info) and request.path_info != settings.LOGIN_URL:
                 login_url = f'{settings.LOGIN_URL}?next={parse.quote(request.get_full_path_info())}'
                 return HttpResponseRedirect(login_url)
 
@@ -47,14 +97,14 @@ class RemoteUserMiddleware(RemoteUserMiddleware_):
     Custom implementation of Django's RemoteUserMiddleware which allows for a user-configurable HTTP header name.
     """
     force_logout_if_no_header = False
+    logger = logging.getLogger('netbox.authentication.RemoteUserMiddleware')
 
     @property
     def header(self):
         return settings.REMOTE_AUTH_HEADER
 
     def process_request(self, request):
-        logger = logging.getLogger(
-            'netbox.authentication.RemoteUserMiddleware')
+        logger = self.logger
         # Bypass middleware if remote authentication is not enabled
         if not settings.REMOTE_AUTH_ENABLED:
             return
@@ -101,8 +151,7 @@ class RemoteUserMiddleware(RemoteUserMiddleware_):
             auth.login(request, user)
 
     def _get_groups(self, request):
-        logger = logging.getLogger(
-            'netbox.authentication.RemoteUserMiddleware')
+        logger = self.logger
 
         groups_string = request.META.get(
             settings.REMOTE_AUTH_GROUP_HEADER, None)
@@ -110,10 +159,14 @@ class RemoteUserMiddleware(RemoteUserMiddleware_):
             groups = groups_string.split(settings.REMOTE_AUTH_GROUP_SEPARATOR)
         else:
             groups = []
-        logger.debug(f"Groups are {groups}")
+        logger.debug("Groups are %s", groups)
         return groups
 
 
+# HTTP methods which are not expected to modify any data
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
 class ObjectChangeMiddleware(object):
     """
     This middleware performs three functions in response to an object being created, updated, or deleted:
@@ -135,7 +188,11 @@ class ObjectChangeMiddleware(object):
     def __call__(self, request):
         # Assign a random unique ID to the request. This will be used to associate multiple object changes made during
         # the same request.
-        request.id = uuid.uuid4()
+        request.id = generate_request_id()
+
+        # Safe (read-only) requests cannot result in any changes, so there is no need to enable change logging
+        if request.method in SAFE_METHODS:
+            return self.get_response(request)
 
         # Process the request with change logging enabled
         with change_logging(request):
@@ -154,11 +211,19 @@ class APIVersionMiddleware(object):
 
     def __call__(self, request):
         response = self.get_response(request)
-        if is_api_request(request):
+        if _is_api_request(request):
             response['API-Version'] = settings.REST_FRAMEWORK_VERSION
         return response
 
 
+# Custom error pages for common exceptions which are likely indicative of installation issues
+EXCEPTION_TEMPLATES = {
+    ProgrammingError: 'exceptions/programming_error.html',
+    ImportError: 'exceptions/import_error.html',
+    PermissionError: 'exceptions/permission_error.html',
+}
+
+
 class ExceptionHandlingMiddleware(object):
     """
     Intercept certain exceptions which are likely indicative of installation issues and provide helpful instructions
@@ -174,7 +239,7 @@ class ExceptionHandlingMiddleware(object):
     def process_exception(self, request, exception):
 
         # Handle exceptions that occur from REST API requests
-        if is_api_request(request):
+        if _is_api_request(request):
             return rest_api_server_error(request)
 
         # Don't catch exceptions when in debug mode
@@ -187,12 +252,10 @@ class ExceptionHandlingMiddleware(object):
 
         # Determine the type of exception. If it's a common issue, return a custom error page with instructions.
         custom_template = None
-        if isinstance(exception, ProgrammingError):
-            custom_template = 'exceptions/programming_error.html'
-        elif isinstance(exception, ImportError):
-            custom_template = 'exceptions/import_error.html'
-        elif isinstance(exception, PermissionError):
-            custom_template = 'exceptions/permission_error.html'
+        for cls in type(exception).__mro__:
+            custom_template = EXCEPTION_TEMPLATES.get(cls)
+            if custom_template:
+                break
 
         # Return a custom error message, or fall back to Django's default 500 error handling
         if custom_template:
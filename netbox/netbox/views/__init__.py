@@ -48,7 +48,7 @@ class HomeView(View):
         )
 
         # Report Results
-        report_content_type = ContentType.objects.get(app_label='extras', model='report')
+        report_content_type = ContentType.objects.get_by_natural_key('extras', 'report')
         report_results = JobResult.objects.filter(
             obj_type=report_content_type,
             status__in=JobResultStatusChoices.TERMINAL_STATE_CHOICES
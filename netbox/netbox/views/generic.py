@@ -16,6 +16,7 @@ from django.utils.safestring import mark_safe
 from django.views.generic import View
 from django_tables2.export import TableExport
 
+from extras.context_managers import defer_objectchanges
 from extras.models import ExportTemplate
 from extras.signals import clear_webhooks
 from utilities.error_handlers import handle_protectederror
@@ -435,7 +436,7 @@ class BulkCreateView(GetReturnURLMixin, ObjectPermissionRequiredMixin, View):
             new_objs = []
 
             try:
-                with transaction.atomic():
+                with transaction.atomic(), defer_objectchanges(request):
 
                     # Create objects from the expanded. Abort the transaction on the first validation error.
                     for value in pattern:
@@ -642,14 +643,17 @@ class BulkImportView(GetReturnURLMixin, ObjectPermissionRequiredMixin, View):
 
     def _import_form(self, *args, **kwargs):
 
+        # Instantiate the model form once to derive the validation rules for both CSV fields
+        model_form = self.model_form()
+
         class ImportForm(BootstrapMixin, Form):
             csv = CSVDataField(
-                from_form=self.model_form,
+                from_form=model_form,
                 widget=Textarea(attrs=self.widget_attrs)
             )
             csv_file = CSVFileField(
                 label="CSV file",
-                from_form=self.model_form,
+                from_form=model_form,
                 required=False
             )
 
@@ -694,7 +698,7 @@ class BulkImportView(GetReturnURLMixin, ObjectPermissionRequiredMixin, View):
 
             try:
                 # Iterate through CSV data and bind each row to a new model form instance.
-                with transaction.atomic():
+                with transaction.atomic(), defer_objectchanges(request):
                     if request.FILES:
                         headers, records = form.cleaned_data['csv_file']
                     else:
@@ -794,7 +798,7 @@ class BulkEditView(GetReturnURLMixin, ObjectPermissionRequiredMixin, View):
 
                 try:
 
-                    with transaction.atomic():
+                    with transaction.atomic(), defer_objectchanges(request):
 
                         updated_objects = []
                         for obj in self.queryset.filter(pk__in=form.cleaned_data['pk']):
@@ -929,7 +933,7 @@ class BulkRenameView(GetReturnURLMixin, ObjectPermissionRequiredMixin, View):
 
             if form.is_valid():
                 try:
-                    with transaction.atomic():
+                    with transaction.atomic(), defer_objectchanges(request):
                         renamed_pks = []
                         for obj in selected_objects:
 
@@ -1028,14 +1032,16 @@ class BulkDeleteView(GetReturnURLMixin, ObjectPermissionRequiredMixin, View):
                 queryset = self.queryset.filter(pk__in=pk_list)
                 deleted_count = queryset.count()
                 try:
-                    for obj in queryset:
-                        # Take a snapshot of change-logged models
-                        if hasattr(obj, 'snapshot'):
-                            obj.snapshot()
-                        obj.delete()
+                    with transaction.atomic(), defer_objectchanges(request):
+                        for obj in queryset:
+                            # Take a snapshot of change-logged models
+                            if hasattr(obj, 'snapshot'):
+                                obj.snapshot()
+                            obj.delete()
                 except ProtectedError as e:
                     logger.info("Caught ProtectedError while attempting to delete objects")
                     handle_protectederror(queryset, request, e)
+                    clear_webhooks.send(sender=self)
                     return redirect(self.get_return_url(request))
 
                 msg = f"Deleted {deleted_count} {model._meta.verbose_name_plural}"
@@ -1161,7 +1167,7 @@ class ComponentCreateView(GetReturnURLMixin, ObjectPermissionRequiredMixin, View
 
             if not form.errors:
                 try:
-                    with transaction.atomic():
+                    with transaction.atomic(), defer_objectchanges(request):
                         # Create the new components
                         new_objs = []
                         for component_form in new_components:
@@ -1230,7 +1236,7 @@ class BulkComponentCreateView(GetReturnURLMixin, ObjectPermissionRequiredMixin,
                 data = deepcopy(form.cleaned_data)
 
                 try:
-                    with transaction.atomic():
+                    with transaction.atomic(), defer_objectchanges(request):
 
                         for obj in data['pk']:
 
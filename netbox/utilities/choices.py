@@ -1,28 +1,4 @@
-class ChoiceSetMeta(type):
-    """
-    Metaclass for ChoiceSet
-    """
-    def __call__(cls, *args, **kwargs):
-        # Django will check if a 'choices' value is callable, and if so assume that it returns an iterable
-        return getattr(cls, 'CHOICES', ())
-
-    def __iter__(cls):
-        choices = getattr(cls, 'CHOICES', ())
-        return iter(choices)
-
-
-class ChoiceSet(metaclass=ChoiceSetMeta):
-
-    CHOICES = list()
-
-    @classmethod
-    def values(cls):
-        return [c[0] for c in unpack_grouped_choices(cls.CHOICES)]
-
-    @classmethod
-    def as_dict(cls):
-        # Unpack grouped choices before casting as a dict
-        return dict(unpack_grouped_choices(cls.CHOICES))
+from types import MappingProxyType
 
 
 def unpack_grouped_choices(choices):
@@ -51,15 +27,52 @@ def unpack_grouped_choices(choices):
     """
     unpacked_choices = []
     for key, value in choices:
-        if isinstance(value, (list, tuple)):
-            # Entered an optgroup
-            for optgroup_key, optgroup_value in value:
-                unpacked_choices.append((optgroup_key, optgroup_value))
+        if type(value) in (list, tuple):
+            # Entered an optgroup (which is already a sequence of two-tuples)
+            unpacked_choices.extend(value)
         else:
             unpacked_choices.append((key, value))
     return unpacked_choices
 
 
+class ChoiceSetMeta(type):
+    """
+    Metaclass for ChoiceSet
+    """
+    def __new__(mcs, name, bases, attrs):
+        cls = super().__new__(mcs, name, bases, attrs)
+
+        # CHOICES is static, so derive its values once. These are shared by all callers and must not be modified, so
+        # store them as immutable types.
+        cls.CHOICES = tuple(cls.CHOICES)
+        unpacked_choices = unpack_grouped_choices(cls.CHOICES)
+        cls._values = tuple(choice[0] for choice in unpacked_choices)
+        cls._as_dict = MappingProxyType(dict(unpacked_choices))
+
+        return cls
+
+    def __call__(cls, *args, **kwargs):
+        # Django will check if a 'choices' value is callable, and if so assume that it returns an iterable
+        return cls.CHOICES
+
+    def __iter__(cls):
+        return iter(cls.CHOICES)
+
+
+class ChoiceSet(metaclass=ChoiceSetMeta):
+
+    CHOICES = ()
+
+    @classmethod
+    def values(cls):
+        return cls._values
+
+    @classmethod
+    def as_dict(cls):
+        # Grouped choices have already been unpacked
+        return cls._as_dict
+
+
 #
 # Generic color choices
 #
@@ -1,3 +1,5 @@
+import re
+
 # String expansion patterns
 NUMERIC_EXPANSION_PATTERN = r'\[((?:\d+[?:,-])+\d+)\]'
 ALPHANUMERIC_EXPANSION_PATTERN = r'\[((?:[a-zA-Z0-9]+[?:,-])+[a-zA-Z0-9]+)\]'
@@ -6,6 +8,14 @@ ALPHANUMERIC_EXPANSION_PATTERN = r'\[((?:[a-zA-Z0-9]+[?:,-])+[a-zA-Z0-9]+)\]'
 IP4_EXPANSION_PATTERN = r'\[((?:[0-9]{1,3}[?:,-])+[0-9]{1,3})\]'
 IP6_EXPANSION_PATTERN = r'\[((?:[0-9a-f]{1,4}[?:,-])+[0-9a-f]{1,4})\]'
 
+# Compiled expansion patterns
+ALPHANUMERIC_EXPANSION_RE = re.compile(ALPHANUMERIC_EXPANSION_PATTERN)
+IP4_EXPANSION_RE = re.compile(IP4_EXPANSION_PATTERN)
+IP6_EXPANSION_RE = re.compile(IP6_EXPANSION_PATTERN)
+
+# The combined bounds of a valid alphanumeric range: either all digits, or all letters of the same case
+ALPHANUMERIC_RANGE_BOUNDS_RE = re.compile(r'[0-9]+|[a-z]+|[A-Z]+')
+
 # Boolean widget choices
 BOOLEAN_WITH_BLANK_CHOICES = (
     ('', '---------'),
@@ -1,6 +1,7 @@
+import codecs
 import csv
+import itertools
 import json
-import re
 from io import StringIO
 
 import django_filters
@@ -8,7 +9,7 @@ from django import forms
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
-from django.db.models import Count, Q
+from django.db.models import Count
 from django.forms import BoundField
 from django.forms.fields import JSONField as _JSONField, InvalidJSONInput
 from django.urls import reverse
@@ -42,6 +43,9 @@ __all__ = (
     'TagFilterField',
 )
 
+# Cache of resolved API list URLs used by dynamic model choice fields, keyed by (app_label, model_name)
+_api_list_urls = {}
+
 
 class CommentField(forms.CharField):
     """
@@ -90,16 +94,30 @@ class TagFilterField(forms.MultipleChoiceField):
     widget = widgets.StaticSelectMultiple
 
     def __init__(self, model, *args, **kwargs):
-        def get_choices():
-            tags = model.tags.annotate(
+        self.model = model
+        self._tag_choices = None
+
+        # Choices are fetched on demand, at most once per form instance
+        super().__init__(label='Tags', choices=self.get_choices, required=False, *args, **kwargs)
+
+    def __deepcopy__(self, memo):
+        result = super().__deepcopy__(memo)
+        # Bind the copied field and its widget to a fresh (unpopulated) set of choices. Deep-copying rebinds the field's
+        # choices to the copy's get_choices(), but the widget makes only a shallow copy of its choices, which would
+        # still call get_choices() on the class-level field.
+        result._tag_choices = None
+        result.widget.choices = result._choices
+        return result
+
+    def get_choices(self):
+        if self._tag_choices is None:
+            tags = self.model.tags.annotate(
                 count=Count('extras_taggeditem_items')
-            ).order_by('name')
-            return [
+            ).order_by('name').only('slug', 'name')
+            self._tag_choices = [
                 (str(tag.slug), '{} ({})'.format(tag.name, tag.count)) for tag in tags
             ]
-
-        # Choices are fetched each time the form is initialized
-        super().__init__(label='Tags', choices=get_choices, required=False, *args, **kwargs)
+        return self._tag_choices
 
 
 class LaxURLField(forms.URLField):
@@ -130,6 +148,8 @@ class JSONField(_JSONField):
 
 
 class ContentTypeChoiceMixin:
+    # ContentType labels are static, so they are cached (by ContentType ID) across all instances
+    _labels = {}
 
     def __init__(self, queryset, *args, **kwargs):
         # Order ContentTypes by app_label
@@ -137,10 +157,13 @@ class ContentTypeChoiceMixin:
         super().__init__(queryset, *args, **kwargs)
 
     def label_from_instance(self, obj):
-        try:
-            return content_type_name(obj)
-        except AttributeError:
-            return super().label_from_instance(obj)
+        label = self._labels.get(obj.pk)
+        if label is None:
+            try:
+                label = self._labels[obj.pk] = content_type_name(obj)
+            except AttributeError:
+                return super().label_from_instance(obj)
+        return label
 
 
 class ContentTypeChoiceField(ContentTypeChoiceMixin, forms.ModelChoiceField):
@@ -161,18 +184,18 @@ class CSVDataField(forms.CharField):
     item is a dictionary of column headers, mapping field names to the attribute by which they match a related object
     (where applicable). The second item is a list of dictionaries, each representing a discrete row of CSV data.
 
-    :param from_form: The form from which the field derives its validation rules.
+    :param from_form: The form (class or instance) from which the field derives its validation rules.
     """
     widget = forms.Textarea
 
     def __init__(self, from_form, *args, **kwargs):
 
-        form = from_form()
+        form = from_form() if isinstance(from_form, type) else from_form
         self.model = form.Meta.model
         self.fields = form.fields
-        self.required_fields = [
+        self.required_fields = tuple(
             name for name, field in form.fields.items() if field.required
-        ]
+        )
 
         super().__init__(*args, **kwargs)
 
@@ -205,17 +228,17 @@ class CSVFileField(forms.FileField):
     by which they match a related object (where applicable). The second item is a list of dictionaries, each
     representing a discrete row of CSV data.
 
-    :param from_form: The form from which the field derives its validation rules.
+    :param from_form: The form (class or instance) from which the field derives its validation rules.
     """
 
     def __init__(self, from_form, *args, **kwargs):
 
-        form = from_form()
+        form = from_form() if isinstance(from_form, type) else from_form
         self.model = form.Meta.model
         self.fields = form.fields
-        self.required_fields = [
+        self.required_fields = tuple(
             name for name, field in form.fields.items() if field.required
-        ]
+        )
 
         super().__init__(*args, **kwargs)
 
@@ -223,12 +246,32 @@ class CSVFileField(forms.FileField):
         if file is None:
             return None
 
-        csv_str = file.read().decode('utf-8').strip()
-        reader = csv.reader(csv_str.splitlines())
+        # Decode and parse the uploaded file line by line rather than reading it into memory in its entirety
+        reader = csv.reader(self._strip_lines(codecs.iterdecode(file, 'utf-8')))
         headers, records = parse_csv(reader)
 
         return headers, records
 
+    @staticmethod
+    def _strip_lines(lines):
+        """
+        Yield each line of the file, omitting any whitespace at the beginning or end of the file as a whole (as
+        str.strip() would). Blank lines are held back until a non-blank line follows them.
+        """
+        lines = itertools.dropwhile(lambda line: not line.strip(), lines)
+        previous_line = next(lines, '').lstrip()
+        blank_lines = []
+        for line in lines:
+            if line.strip():
+                yield previous_line
+                yield from blank_lines
+                blank_lines.clear()
+                previous_line = line
+            else:
+                blank_lines.append(line)
+        if previous_line:
+            yield previous_line.rstrip()
+
     def validate(self, value):
         if value is None:
             return None
@@ -299,11 +342,15 @@ class CSVMultipleContentTypeField(forms.ModelMultipleChoiceField):
     # TODO: Improve validation of selected ContentTypes
     def prepare_value(self, value):
         if type(value) is str:
-            ct_filter = Q()
+            # Resolve each ContentType via its natural key, which is cached in memory after the first lookup
+            pk_list = []
             for name in value.split(','):
                 app_label, model = name.split('.')
-                ct_filter |= Q(app_label=app_label, model=model)
-            return list(ContentType.objects.filter(ct_filter).values_list('pk', flat=True))
+                try:
+                    pk_list.append(ContentType.objects.get_by_natural_key(app_label, model).pk)
+                except ObjectDoesNotExist:
+                    continue
+            return pk_list
         return super().prepare_value(value)
 
 
@@ -332,7 +379,7 @@ class ExpandableNameField(forms.CharField):
     def to_python(self, value):
         if not value:
             return ''
-        if re.search(ALPHANUMERIC_EXPANSION_PATTERN, value):
+        if '[' in value and ALPHANUMERIC_EXPANSION_RE.search(value):
             return list(expand_alphanumeric_pattern(value))
         return [value]
 
@@ -350,10 +397,13 @@ class ExpandableIPAddressField(forms.CharField):
                              'Example: <code>192.0.2.[1,5,100-254]/24</code>'
 
     def to_python(self, value):
+        # Skip pattern matching entirely for values without a range
+        if '[' not in value:
+            return [value]
         # Hackish address family detection but it's all we have to work with
-        if '.' in value and re.search(IP4_EXPANSION_PATTERN, value):
+        if '.' in value and IP4_EXPANSION_RE.search(value):
             return list(expand_ipaddress_pattern(value, 4))
-        elif ':' in value and re.search(IP6_EXPANSION_PATTERN, value):
+        elif ':' in value and IP6_EXPANSION_RE.search(value):
             return list(expand_ipaddress_pattern(value, 6))
         return [value]
 
@@ -390,6 +440,9 @@ class DynamicModelChoiceMixin:
 
         super().__init__(*args, **kwargs)
 
+        # The filter used to limit the QuerySet to bound data depends only on to_field_name, so build it once
+        self._data_filter = self.filter(field_name=self.to_field_name or 'pk')
+
     def widget_attrs(self, widget):
         attrs = {
             'data-empty-option': self.empty_option
@@ -417,6 +470,11 @@ class DynamicModelChoiceMixin:
 
         return attrs
 
+    def _set_empty_queryset(self):
+        # Avoid cloning the QuerySet if it has already been emptied
+        if not self.queryset.query.is_empty():
+            self.queryset = self.queryset.none()
+
     def get_bound_field(self, form, field_name):
         bound_field = BoundField(form, self, field_name)
 
@@ -434,22 +492,22 @@ class DynamicModelChoiceMixin:
         # will be populated on-demand via the APISelect widget.
         data = bound_field.value()
         if data:
-            field_name = getattr(self, 'to_field_name') or 'pk'
-            filter = self.filter(field_name=field_name)
             try:
-                self.queryset = filter.filter(self.queryset, data)
+                self.queryset = self._data_filter.filter(self.queryset, data)
             except (TypeError, ValueError):
                 # Catch any error caused by invalid initial data passed from the user
-                self.queryset = self.queryset.none()
+                self._set_empty_queryset()
         else:
-            self.queryset = self.queryset.none()
+            self._set_empty_queryset()
 
         # Set the data URL on the APISelect widget (if not already set)
         widget = bound_field.field.widget
         if not widget.attrs.get('data-url'):
             app_label = self.queryset.model._meta.app_label
             model_name = self.queryset.model._meta.model_name
-            data_url = reverse('{}-api:{}-list'.format(app_label, model_name))
+            data_url = _api_list_urls.get((app_label, model_name))
+            if data_url is None:
+                data_url = _api_list_urls[(app_label, model_name)] = reverse(f'{app_label}-api:{model_name}-list')
             widget.attrs['data-url'] = data_url
 
         return bound_field
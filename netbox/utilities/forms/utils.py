@@ -1,4 +1,4 @@
-import re
+import itertools
 
 from django import forms
 from django.conf import settings
@@ -29,7 +29,7 @@ def parse_numeric_range(string, base=10):
       '0-3,5' => [0, 1, 2, 3, 5]
       '2,8-b,d,f' => [2, 8, 9, a, b, d, f]
     """
-    values = list()
+    ranges = []
     for dash_range in string.split(','):
         try:
             begin, end = dash_range.split('-')
@@ -39,8 +39,18 @@ def parse_numeric_range(string, base=10):
             begin, end = int(begin.strip(), base=base), int(end.strip(), base=base) + 1
         except ValueError:
             raise forms.ValidationError(f'Range "{dash_range}" is invalid.')
-        values.extend(range(begin, end))
-    return list(set(values))
+        if begin < end:
+            ranges.append((begin, end))
+
+    # Merge overlapping and adjacent ranges rather than de-duplicating the individual values
+    merged = []
+    for begin, end in sorted(ranges):
+        if merged and begin <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([begin, end])
+
+    return list(itertools.chain.from_iterable(range(begin, end) for begin, end in merged))
 
 
 def parse_alphanumeric_range(string):
@@ -55,13 +65,12 @@ def parse_alphanumeric_range(string):
             begin, end = dash_range.split('-')
             vals = begin + end
             # Break out of loop if there's an invalid pattern to return an error
-            if (not (vals.isdigit() or vals.isalpha())) or (vals.isalpha() and not (vals.isupper() or vals.islower())):
+            if not ALPHANUMERIC_RANGE_BOUNDS_RE.fullmatch(vals):
                 return []
         except ValueError:
             begin, end = dash_range, dash_range
         if begin.isdigit() and end.isdigit():
-            for n in list(range(int(begin), int(end) + 1)):
-                values.append(n)
+            values.extend(range(int(begin), int(end) + 1))
         else:
             # Value-based
             if begin == end:
@@ -71,23 +80,45 @@ def parse_alphanumeric_range(string):
                 # Not a valid range (more than a single character)
                 if not len(begin) == len(end) == 1:
                     raise forms.ValidationError(f'Range "{dash_range}" is invalid.')
-                for n in list(range(ord(begin), ord(end) + 1)):
-                    values.append(chr(n))
+                values.extend(map(chr, range(ord(begin), ord(end) + 1)))
     return values
 
 
+def _expand_pattern(string, regex, expand_range):
+    """
+    Expand each bracketed range in a string matched by the given regex, and yield every resulting combination. The
+    string is split into literal segments and the lists of values returned by expand_range(), from which the
+    combinations are taken as a Cartesian product.
+    """
+    segments = []
+    position = 0
+    for match in regex.finditer(string):
+        if match.start() > position:
+            segments.append((string[position:match.start()],))
+        values = expand_range(match.group(1))
+        # An empty range yields no combinations, so any subsequent ranges are not parsed (or validated)
+        if not values:
+            return
+        segments.append(values)
+        position = match.end()
+    if not segments:
+        raise ValueError(f'No expansion pattern found in "{string}"')
+    if position < len(string):
+        segments.append((string[position:],))
+
+    # Each range has already been converted to strings, so each combination need only be joined
+    yield from map(''.join, itertools.product(*segments))
+
+
 def expand_alphanumeric_pattern(string):
     """
     Expand an alphabetic pattern into a list of strings.
     """
-    lead, pattern, remnant = re.split(ALPHANUMERIC_EXPANSION_PATTERN, string, maxsplit=1)
-    parsed_range = parse_alphanumeric_range(pattern)
-    for i in parsed_range:
-        if re.search(ALPHANUMERIC_EXPANSION_PATTERN, remnant):
-            for string in expand_alphanumeric_pattern(remnant):
-                yield "{}{}{}".format(lead, i, string)
-        else:
-            yield "{}{}{}".format(lead, i, remnant)
+    return _expand_pattern(
+        string,
+        ALPHANUMERIC_EXPANSION_RE,
+        lambda pattern: [str(value) for value in parse_alphanumeric_range(pattern)]
+    )
 
 
 def expand_ipaddress_pattern(string, family):
@@ -99,19 +130,19 @@ def expand_ipaddress_pattern(string, family):
     if family not in [4, 6]:
         raise Exception("Invalid IP address family: {}".format(family))
     if family == 4:
-        regex = IP4_EXPANSION_PATTERN
+        regex = IP4_EXPANSION_RE
         base = 10
+        fmt = 'd'
     else:
-        regex = IP6_EXPANSION_PATTERN
+        regex = IP6_EXPANSION_RE
         base = 16
-    lead, pattern, remnant = re.split(regex, string, maxsplit=1)
-    parsed_range = parse_numeric_range(pattern, base)
-    for i in parsed_range:
-        if re.search(regex, remnant):
-            for string in expand_ipaddress_pattern(remnant, family):
-                yield ''.join([lead, format(i, 'x' if family == 6 else 'd'), string])
-        else:
-            yield ''.join([lead, format(i, 'x' if family == 6 else 'd'), remnant])
+        fmt = 'x'
+
+    return _expand_pattern(
+        string,
+        regex,
+        lambda pattern: [format(value, fmt) for value in parse_numeric_range(pattern, base)]
+    )
 
 
 def get_selected_values(form, field_name):
@@ -119,7 +150,10 @@ def get_selected_values(form, field_name):
     Return the list of selected human-friendly values for a form field
     """
     if not hasattr(form, 'cleaned_data'):
-        form.is_valid()
+        # An unbound form has no selected values
+        if not form.is_bound:
+            return []
+        form.full_clean()
     filter_data = form.cleaned_data.get(field_name)
     field = form.fields[field_name]
 
@@ -127,21 +161,29 @@ def get_selected_values(form, field_name):
     if not hasattr(field, 'choices'):
         return [str(filter_data)]
 
+    if type(filter_data) not in (list, tuple):
+        filter_data = [filter_data]  # Ensure filter data is iterable
+
     # Get choice labels
     if type(field.choices) is forms.models.ModelChoiceIterator:
-        # Field uses dynamic choices: show all that have been populated on the widget
+        # Field uses dynamic choices: show all that have been populated on the widget. Binding the field limits its
+        # choices to the selected objects; their labels are then read directly from the choices, rather than by
+        # rendering a subwidget for each option.
+        bound_field = form[field_name]
         values = [
-            subwidget.choice_label for subwidget in form[field_name].subwidgets
+            label for value, label in bound_field.field.choices
         ]
 
     else:
-        # Static selection field
-        choices = unpack_grouped_choices(field.choices)
-        if type(filter_data) not in (list, tuple):
-            filter_data = [filter_data]  # Ensure filter data is iterable
-        values = [
-            label for value, label in choices if str(value) in filter_data or None in filter_data
-        ]
+        # Static selection field: flatten its choices once per field instance
+        choices = getattr(field, '_flat_choices', None)
+        if choices is None:
+            choices = field._flat_choices = tuple(unpack_grouped_choices(field.choices))
+        selected = set(filter_data)
+        if None in selected:
+            values = [label for value, label in choices]
+        else:
+            values = [label for value, label in choices if str(value) in selected]
 
     if hasattr(field, 'null_option'):
         # If the field has a `null_option` attribute set and it is selected,
@@ -178,7 +220,7 @@ def restrict_form_fields(form, user, action='view'):
     as available choices.
     """
     for field in form.fields.values():
-        if hasattr(field, 'queryset') and issubclass(field.queryset.__class__, RestrictedQuerySet):
+        if isinstance(getattr(field, 'queryset', None), RestrictedQuerySet):
             field.queryset = field.queryset.restrict(user, action)
 
 
@@ -202,14 +244,14 @@ def parse_csv(reader):
             headers[header] = None
 
     # Parse CSV rows into a list of dictionaries mapped from the column headers.
+    header_names = tuple(headers)
+    column_count = len(header_names)
     for i, row in enumerate(reader, start=1):
-        if len(row) != len(headers):
+        if len(row) != column_count:
             raise forms.ValidationError(
-                f"Row {i}: Expected {len(headers)} columns but found {len(row)}"
+                f"Row {i}: Expected {column_count} columns but found {len(row)}"
             )
-        row = [col.strip() for col in row]
-        record = dict(zip(headers.keys(), row))
-        records.append(record)
+        records.append(dict(zip(header_names, map(str.strip, row))))
 
     return headers, records
 
@@ -223,10 +265,12 @@ def validate_csv(headers, fields, required_fields):
     for field, to_field in headers.items():
         if field not in fields:
             raise forms.ValidationError(f'Unexpected column header "{field}" found.')
-        if to_field and not hasattr(fields[field], 'to_field_name'):
-            raise forms.ValidationError(f'Column "{field}" is not a related object; cannot use dots')
-        if to_field and not hasattr(fields[field].queryset.model, to_field):
-            raise forms.ValidationError(f'Invalid related object attribute for column "{field}": {to_field}')
+        if to_field:
+            form_field = fields[field]
+            if not hasattr(form_field, 'to_field_name'):
+                raise forms.ValidationError(f'Column "{field}" is not a related object; cannot use dots')
+            if not hasattr(form_field.queryset.model, to_field):
+                raise forms.ValidationError(f'Invalid related object attribute for column "{field}": {to_field}')
 
     # Validate required fields
     for f in required_fields:
@@ -6,12 +6,13 @@ class EnhancedPaginator(Paginator):
 
     def __init__(self, object_list, per_page, orphans=None, **kwargs):
 
-        # Determine the page size
-        try:
-            per_page = int(per_page)
-            if per_page < 1:
+        # Determine the page size (typically already an integer from get_paginate_count())
+        if type(per_page) is not int:
+            try:
+                per_page = int(per_page)
+            except ValueError:
                 per_page = settings.PAGINATE_COUNT
-        except ValueError:
+        if per_page < 1:
             per_page = settings.PAGINATE_COUNT
 
         # Set orphans count based on page size
@@ -30,21 +31,27 @@ class EnhancedPage(Page):
 
     def smart_pages(self):
 
+        num_pages = self.paginator.num_pages
+
         # When dealing with five or fewer pages, simply return the whole list.
-        if self.paginator.num_pages <= 5:
+        if num_pages <= 5:
             return self.paginator.page_range
 
         # Show first page, last page, next/previous two pages, and current page
         n = self.number
-        pages_wanted = [1, n - 2, n - 1, n, n + 1, n + 2, self.paginator.num_pages]
-        page_list = sorted(set(self.paginator.page_range).intersection(pages_wanted))
+        pages_wanted = (1, n - 2, n - 1, n, n + 1, n + 2, num_pages)
+        page_list = sorted({page for page in pages_wanted if 1 <= page <= num_pages})
 
-        # Insert skip markers
-        skip_pages = [x[1] for x in zip(page_list[:-1], page_list[1:]) if (x[1] - x[0] != 1)]
-        for i in skip_pages:
-            page_list.insert(page_list.index(i), False)
+        # Insert skip markers between non-consecutive pages (the list always begins with page 1)
+        pages = []
+        previous_page = 0
+        for page in page_list:
+            if page - previous_page != 1:
+                pages.append(False)
+            pages.append(page)
+            previous_page = page
 
-        return page_list
+        return pages
 
 
 def get_paginate_count(request):
@@ -60,7 +67,8 @@ def get_paginate_count(request):
     if 'per_page' in request.GET:
         try:
             per_page = int(request.GET.get('per_page'))
-            if request.user.is_authenticated:
+            # Save the page length as the user's preference, if it has changed
+            if request.user.is_authenticated and request.user.config.get('pagination.per_page') != per_page:
                 request.user.config.set('pagination.per_page', per_page, commit=True)
             return min(per_page, settings.MAX_PAGE_SIZE)
         except ValueError:
@@ -29,7 +29,7 @@ class ExampleChoices(ChoiceSet):
 class ChoiceSetTestCase(TestCase):
 
     def test_values(self):
-        self.assertListEqual(ExampleChoices.values(), ['a', 'b', 'c', 1, 2, 3])
+        self.assertTupleEqual(ExampleChoices.values(), ('a', 'b', 'c', 1, 2, 3))
 
     def test_as_dict(self):
         self.assertEqual(ExampleChoices.as_dict(), {
@@ -468,6 +468,26 @@ class DynamicFilterLookupExpressionTest(TestCase):
         params = {'name__n': ['Device 1']}
         self.assertEqual(DeviceFilterSet(params, self.device_queryset).qs.count(), 2)
 
+    def test_device_name_empty(self):
+        device = Device.objects.first()
+        Device.objects.bulk_create((
+            Device(name='', device_type=device.device_type, device_role=device.device_role, site=device.site),
+            Device(name=None, device_type=device.device_type, device_role=device.device_role, site=device.site),
+        ))
+
+        # A NULL name is considered neither empty nor non-empty
+        params = {'name__empty': ['true']}
+        self.assertEqual(DeviceFilterSet(params, self.device_queryset).qs.count(), 1)
+        params = {'name__empty': ['false']}
+        self.assertEqual(DeviceFilterSet(params, self.device_queryset).qs.count(), 3)
+
+        # Verify parity with the original CAST(LENGTH()) expression
+        for value in (True, False):
+            self.assertEqual(
+                set(Device.objects.filter(name__empty=value)),
+                set(Device.objects.extra(where=['CAST(LENGTH("dcim_device"."name") AS BOOLEAN) != %s'], params=[value]))
+            )
+
     def test_device_name_startswith(self):
         params = {'name__isw': ['Device']}
         self.assertEqual(DeviceFilterSet(params, self.device_queryset).qs.count(), 3)
@@ -1,9 +1,42 @@
 from django import forms
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
 
+from dcim.models import Site
+from extras.models import Tag
 from ipam.forms import IPAddressCSVForm
-from utilities.forms.fields import CSVDataField
-from utilities.forms.utils import expand_alphanumeric_pattern, expand_ipaddress_pattern
+from utilities.forms.fields import CSVDataField, CSVFileField, TagFilterField
+from utilities.forms.utils import expand_alphanumeric_pattern, expand_ipaddress_pattern, parse_numeric_range
+
+
+class ParseNumericRange(TestCase):
+    """
+    Validate the operation of parse_numeric_range().
+    """
+    def test_range_and_value(self):
+        self.assertEqual(parse_numeric_range('0-3,5'), [0, 1, 2, 3, 5])
+
+    def test_hexadecimal(self):
+        self.assertEqual(parse_numeric_range('2,8-b,d,f', base=16), [2, 8, 9, 10, 11, 13, 15])
+
+    def test_overlapping_ranges(self):
+        self.assertEqual(parse_numeric_range('1-5,3-8'), [1, 2, 3, 4, 5, 6, 7, 8])
+        self.assertEqual(parse_numeric_range('1-10,2-3'), [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+
+    def test_adjacent_ranges(self):
+        self.assertEqual(parse_numeric_range('1-3,4-6'), [1, 2, 3, 4, 5, 6])
+
+    def test_unordered_and_duplicate_values(self):
+        self.assertEqual(parse_numeric_range('7,1-3,2,7'), [1, 2, 3, 7])
+
+    def test_reversed_range(self):
+        # A range whose end precedes its beginning contains no values
+        self.assertEqual(parse_numeric_range('5-2'), [])
+        self.assertEqual(parse_numeric_range('5-2,7'), [7])
+
+    def test_invalid_range(self):
+        with self.assertRaises(forms.ValidationError):
+            parse_numeric_range('1-x')
 
 
 class ExpandIPAddress(TestCase):
@@ -131,6 +164,17 @@ class ExpandIPAddress(TestCase):
 
         self.assertEqual(sorted(expand_ipaddress_pattern(input, 6)), output)
 
+    def test_ipv4_multiple_groups_order(self):
+        input = '192.0.[1,2].[10-11]/24'
+        output = [
+            '192.0.1.10/24',
+            '192.0.1.11/24',
+            '192.0.2.10/24',
+            '192.0.2.11/24',
+        ]
+
+        self.assertEqual(list(expand_ipaddress_pattern(input, 4)), output)
+
     def test_invalid_address_family(self):
         with self.assertRaisesRegex(Exception, 'Invalid IP address family: 5'):
             sorted(expand_ipaddress_pattern(None, 5))
@@ -245,6 +289,36 @@ class ExpandAlphanumeric(TestCase):
 
         self.assertEqual(sorted(expand_alphanumeric_pattern(input)), output)
 
+    def test_multiple_groups_order(self):
+        input = '[a,b]-[1-2]x[3,4]'
+        output = [
+            'a-1x3',
+            'a-1x4',
+            'a-2x3',
+            'a-2x4',
+            'b-1x3',
+            'b-1x4',
+            'b-2x3',
+            'b-2x4',
+        ]
+
+        self.assertEqual(list(expand_alphanumeric_pattern(input)), output)
+
+    def test_adjacent_groups(self):
+        input = '[a,b][1,2]'
+        output = [
+            'a1',
+            'a2',
+            'b1',
+            'b2',
+        ]
+
+        self.assertEqual(list(expand_alphanumeric_pattern(input)), output)
+
+    def test_invalid_range_precedes_invalid_range(self):
+        # A range which yields no values prevents subsequent ranges from being validated
+        self.assertEqual(list(expand_alphanumeric_pattern('[A-3][a-ff]')), [])
+
     def test_invalid_non_pattern(self):
         with self.assertRaises(ValueError):
             sorted(expand_alphanumeric_pattern('r9a'))
@@ -365,3 +439,80 @@ class CSVDataFieldTest(TestCase):
         """
         with self.assertRaises(forms.ValidationError):
             self.field.clean(input)
+
+    def test_clean_multiline_value(self):
+        input = 'address,status,vrf\n192.0.2.1/32,Active,"Test\nVRF"'
+        output = (
+            {'address': None, 'status': None, 'vrf': None},
+            [{'address': '192.0.2.1/32', 'status': 'Active', 'vrf': 'Test\nVRF'}]
+        )
+        self.assertEqual(self.field.clean(input), output)
+
+    def test_clean_unicode_line_separator(self):
+        # Only newlines delimit records; other line boundaries (e.g. U+2028) form part of the value
+        input = 'address,status,vrf\n192.0.2.1/32,Active,Test\u2028VRF'
+        output = (
+            {'address': None, 'status': None, 'vrf': None},
+            [{'address': '192.0.2.1/32', 'status': 'Active', 'vrf': 'Test\u2028VRF'}]
+        )
+        self.assertEqual(self.field.clean(input), output)
+
+
+class CSVFileFieldTest(TestCase):
+
+    def setUp(self):
+        self.field = CSVFileField(from_form=IPAddressCSVForm)
+
+    def test_clean_leading_trailing_blank_rows(self):
+        file = SimpleUploadedFile('test.csv', b'\n\naddress,status,vrf\n192.0.2.1/32,Active,Test VRF\n\n\n')
+        output = (
+            {'address': None, 'status': None, 'vrf': None},
+            [{'address': '192.0.2.1/32', 'status': 'Active', 'vrf': 'Test VRF'}]
+        )
+        self.assertEqual(self.field.clean(file), output)
+
+    def test_clean_leading_trailing_whitespace(self):
+        file = SimpleUploadedFile('test.csv', b'  \n\t address,status,vrf\n192.0.2.1/32,Active,Test VRF\n   \n\t\n')
+        output = (
+            {'address': None, 'status': None, 'vrf': None},
+            [{'address': '192.0.2.1/32', 'status': 'Active', 'vrf': 'Test VRF'}]
+        )
+        self.assertEqual(self.field.clean(file), output)
+
+    def test_clean_interior_blank_row(self):
+        file = SimpleUploadedFile('test.csv', b'address,status,vrf\n\n192.0.2.1/32,Active,Test VRF\n')
+        with self.assertRaisesMessage(forms.ValidationError, 'Row 1: Expected 3 columns but found 0'):
+            self.field.clean(file)
+
+
+class TagFilterFieldTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        tag = Tag.objects.create(name='Tag 1', slug='tag-1')
+        site = Site.objects.create(name='Site 1', slug='site-1')
+        site.tags.set(tag)
+
+    def test_choices_fetched_once_per_form(self):
+
+        class SiteFilterForm(forms.Form):
+            tag = TagFilterField(Site)
+
+        for _ in range(2):
+            field = SiteFilterForm().fields['tag']
+            with self.assertNumQueries(1):
+                self.assertEqual(list(field.choices), [('tag-1', 'Tag 1 (1)')])
+                self.assertEqual(list(field.choices), [('tag-1', 'Tag 1 (1)')])
+                field.widget.render('tag', None)
+
+    def test_widget_renders_form_choices(self):
+
+        class SiteFilterForm(forms.Form):
+            tag = TagFilterField(Site)
+
+        # Populate the class-level field with stale choices; the form's copy must not use them
+        SiteFilterForm.base_fields['tag']._tag_choices = [('stale', 'Stale (1)')]
+
+        output = SiteFilterForm().fields['tag'].widget.render('tag', None)
+        self.assertIn('tag-1', output)
+        self.assertNotIn('stale', output)
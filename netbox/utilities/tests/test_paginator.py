@@ -0,0 +1,40 @@
+from django.test import TestCase
+
+from utilities.paginator import EnhancedPaginator
+
+
+class SmartPagesTest(TestCase):
+    """
+    Validate the page numbers and skip markers (False) returned by EnhancedPage.smart_pages().
+    """
+    def get_smart_pages(self, num_pages, number):
+        paginator = EnhancedPaginator(list(range(num_pages * 10)), 10, orphans=0)
+        self.assertEqual(paginator.num_pages, num_pages)
+
+        return list(paginator.page(number).smart_pages())
+
+    def test_five_or_fewer_pages(self):
+        self.assertEqual(self.get_smart_pages(1, 1), [1])
+        for number in range(1, 6):
+            self.assertEqual(self.get_smart_pages(5, number), [1, 2, 3, 4, 5])
+
+    def test_first_pages(self):
+        self.assertEqual(self.get_smart_pages(100, 1), [1, 2, 3, False, 100])
+        self.assertEqual(self.get_smart_pages(100, 2), [1, 2, 3, 4, False, 100])
+        self.assertEqual(self.get_smart_pages(100, 3), [1, 2, 3, 4, 5, False, 100])
+        self.assertEqual(self.get_smart_pages(100, 4), [1, 2, 3, 4, 5, 6, False, 100])
+        self.assertEqual(self.get_smart_pages(100, 5), [1, False, 3, 4, 5, 6, 7, False, 100])
+
+    def test_middle_page(self):
+        self.assertEqual(self.get_smart_pages(100, 50), [1, False, 48, 49, 50, 51, 52, False, 100])
+
+    def test_last_pages(self):
+        self.assertEqual(self.get_smart_pages(100, 97), [1, False, 95, 96, 97, 98, 99, 100])
+        self.assertEqual(self.get_smart_pages(100, 98), [1, False, 96, 97, 98, 99, 100])
+        self.assertEqual(self.get_smart_pages(100, 99), [1, False, 97, 98, 99, 100])
+        self.assertEqual(self.get_smart_pages(100, 100), [1, False, 98, 99, 100])
+
+    def test_six_pages(self):
+        self.assertEqual(self.get_smart_pages(6, 1), [1, 2, 3, False, 6])
+        self.assertEqual(self.get_smart_pages(6, 3), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(self.get_smart_pages(6, 6), [1, False, 4, 5, 6])